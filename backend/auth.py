@@ -2,9 +2,11 @@ from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from dotenv import load_dotenv
 import os
 
@@ -18,15 +20,31 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2id for new hashes; bcrypt stays verifiable so accounts created
+# before the swap keep working, and deprecated="auto" flags their hashes
+# for a transparent upgrade on the next successful login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 security = HTTPBearer()
 
+# Doctor rows rarely change; caching them briefly saves one SELECT per
+# authenticated request on every protected endpoint
+doctor_cache = TTLCache(maxsize=1024, ttl=60)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    return pwd_context.needs_update(hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -37,9 +55,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_doctor(
+async def get_current_doctor(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Doctor:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -57,7 +75,11 @@ def get_current_doctor(
     except JWTError:
         raise credentials_exception
     
-    doctor = db.query(Doctor).filter(Doctor.email == token_data.email).first()
+    doctor = doctor_cache.get(token_data.email)
     if doctor is None:
-        raise credentials_exception
+        result = await db.execute(select(Doctor).where(Doctor.email == token_data.email))
+        doctor = result.scalar_one_or_none()
+        if doctor is None:
+            raise credentials_exception
+        doctor_cache[token_data.email] = doctor
     return doctor
@@ -1,6 +1,6 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import declarative_base, raiseload, Session
 from dotenv import load_dotenv
 import os
 
@@ -8,14 +8,43 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Accept the old sync driver scheme so existing .env files keep working
+if DATABASE_URL and DATABASE_URL.startswith("mysql+pymysql://"):
+    DATABASE_URL = DATABASE_URL.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=os.getenv("SQL_ECHO") == "1",
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+class GuardedSession(Session):
+    """Sync session backing AsyncSession; exists so ORM events attach to our sessions only"""
+
+@event.listens_for(GuardedSession, "do_orm_execute")
+def _block_lazy_loads(execute_state):
+    # There are no relationships yet, but if one is added later any
+    # accidental lazy load raises here instead of silently going N+1
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+    ):
+        execute_state.statement = execute_state.statement.options(raiseload("*"))
+
+SessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=GuardedSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
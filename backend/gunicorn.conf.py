@@ -0,0 +1,7 @@
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = "worker.AppWorker"
+preload_app = True
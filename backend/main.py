@@ -1,38 +1,96 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
 from datetime import timedelta
 from typing import List
+import anyio.to_thread
+import os
 
 from database import get_db, engine, Base
 from models import Doctor, Patient
 from schemas import (
     DoctorRegister, DoctorLogin, DoctorResponse, Token,
-    PatientCreate, PatientUpdate, PatientResponse
+    PatientCreate, PatientUpdate, PatientResponse, PatientListItem
 )
 from auth import (
-    get_password_hash, verify_password, create_access_token,
-    get_current_doctor, ACCESS_TOKEN_EXPIRE_MINUTES
+    get_password_hash, verify_password, password_needs_rehash,
+    create_access_token, get_current_doctor, ACCESS_TOKEN_EXPIRE_MINUTES
 )
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 app = FastAPI(
     title="Patient Management System API",
     description="A REST API for managing patient records",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+# Batch serializer for the list endpoint; validating and dumping the whole
+# list at once keeps the work inside pydantic-core instead of per-item
+# Python dispatch through FastAPI's response_model path
+patient_list_adapter = TypeAdapter(List[PatientListItem])
+
+# Pre-bound dump methods for the write paths; saves the per-request
+# attribute lookup on the instance
+dump_patient_create = PatientCreate.model_dump
+dump_patient_update = PatientUpdate.model_dump
+
+# CORS middleware; concrete origins let Starlette do an O(1) set lookup
+# instead of the wildcard path, and "*" with credentials is invalid anyway
+ALLOWED_ORIGINS = os.getenv(
+    "ALLOWED_ORIGINS",
+    "https://patient-management-system-chi-blue.vercel.app,http://localhost:3000"
+).split(",")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
+@app.on_event("startup")
+async def create_tables():
+    # Create database tables only when explicitly asked; normal workers
+    # skip the schema introspection round trips and come up faster
+    if os.getenv("RUN_MIGRATIONS") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await upgrade_existing_tables(conn)
+
+async def upgrade_existing_tables(conn):
+    # create_all never alters tables that already exist, so databases
+    # created before the generated bmi column and the patients indexes
+    # get them added here
+    has_bmi = await conn.scalar(text(
+        "SELECT COUNT(*) FROM information_schema.columns "
+        "WHERE table_schema = DATABASE() AND table_name = 'patients' "
+        "AND column_name = 'bmi'"
+    ))
+    if not has_bmi:
+        await conn.execute(text(
+            "ALTER TABLE patients ADD COLUMN bmi FLOAT "
+            "GENERATED ALWAYS AS (ROUND(weight / (height * height), 2)) STORED"
+        ))
+    for index_name, columns in (
+        ("ix_patients_created_at", "created_at DESC"),
+        ("ix_patients_gender_age", "gender, age"),
+        ("ix_patients_city", "city"),
+    ):
+        index_exists = await conn.scalar(text(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'patients' "
+            "AND index_name = :name"
+        ), {"name": index_name})
+        if not index_exists:
+            await conn.execute(text(
+                f"CREATE INDEX {index_name} ON patients ({columns})"
+            ))
+
 @app.get("/", tags=["Root"])
 def read_root():
     """Root endpoint - API health check"""
@@ -45,80 +103,109 @@ def read_root():
 
 # Authentication Endpoints
 @app.post("/auth/register", response_model=DoctorResponse, status_code=status.HTTP_201_CREATED)
-def register_doctor(doctor_data: DoctorRegister, db: Session = Depends(get_db)):
-    # Check if doctor already exists
-    existing_doctor = db.query(Doctor).filter(Doctor.email == doctor_data.email).first()
-    if existing_doctor:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # Create new doctor
-    hashed_password = get_password_hash(doctor_data.password)
+async def register_doctor(doctor_data: DoctorRegister, db: AsyncSession = Depends(get_db)):
+    # Create new doctor; the unique index on email catches duplicates,
+    # saving the SELECT round trip a pre-check would cost. Hashing takes
+    # tens of milliseconds, so it runs in the threadpool rather than
+    # blocking the event loop
+    hashed_password = await anyio.to_thread.run_sync(
+        get_password_hash, doctor_data.password
+    )
     new_doctor = Doctor(
         name=doctor_data.name,
         email=doctor_data.email,
         password_hash=hashed_password
     )
     db.add(new_doctor)
-    db.commit()
-    db.refresh(new_doctor)
-    
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    await db.refresh(new_doctor)
+
     return new_doctor
 
 @app.post("/auth/login", response_model=Token)
-def login_doctor(login_data: DoctorLogin, db: Session = Depends(get_db)):
+async def login_doctor(login_data: DoctorLogin, db: AsyncSession = Depends(get_db)):
     # Find doctor by email
-    doctor = db.query(Doctor).filter(Doctor.email == login_data.email).first()
-    if not doctor or not verify_password(login_data.password, doctor.password_hash):
+    result = await db.execute(select(Doctor).where(Doctor.email == login_data.email))
+    doctor = result.scalar_one_or_none()
+    if not doctor or not await anyio.to_thread.run_sync(
+        verify_password, login_data.password, doctor.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
+    # Transparently upgrade legacy bcrypt hashes on successful login
+    if password_needs_rehash(doctor.password_hash):
+        doctor.password_hash = await anyio.to_thread.run_sync(
+            get_password_hash, login_data.password
+        )
+        await db.commit()
+
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": doctor.email}, expires_delta=access_token_expires
     )
-    
+
     return {"access_token": access_token, "token_type": "bearer"}
 
 @app.get("/auth/me", response_model=DoctorResponse)
-def get_current_doctor_info(current_doctor: Doctor = Depends(get_current_doctor)):
+async def get_current_doctor_info(current_doctor: Doctor = Depends(get_current_doctor)):
     return current_doctor
 
 # Patient Endpoints (All Protected)
 @app.post("/patients", response_model=PatientResponse, status_code=status.HTTP_201_CREATED)
-def create_patient(
+async def create_patient(
     patient_data: PatientCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_doctor: Doctor = Depends(get_current_doctor)
 ):
-    new_patient = Patient(**patient_data.model_dump())
+    new_patient = Patient(**dump_patient_create(patient_data))
     db.add(new_patient)
-    db.commit()
-    db.refresh(new_patient)
-    
+    await db.commit()
+    await db.refresh(new_patient)
+
     return new_patient
 
-@app.get("/patients", response_model=List[PatientResponse])
-def list_patients(
-    db: Session = Depends(get_db),
+@app.get("/patients", response_model=List[PatientListItem])
+async def list_patients(
+    skip: int = Query(0, ge=0, description="Number of patients to skip"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum patients per page"),
+    db: AsyncSession = Depends(get_db),
     current_doctor: Doctor = Depends(get_current_doctor)
 ):
-    patients = db.query(Patient).all()
-    return patients
+    # Explicit projection of the columns the list view renders - which
+    # includes diagnosis/prescription, since the dashboard cards show
+    # them and the edit modal is seeded from list items
+    result = await db.execute(
+        select(
+            Patient.id, Patient.name, Patient.city, Patient.age,
+            Patient.gender, Patient.height, Patient.weight, Patient.bmi,
+            Patient.diagnosis, Patient.prescription, Patient.created_at
+        ).order_by(Patient.id).offset(skip).limit(limit)
+    )
+    patients = patient_list_adapter.validate_python(result.all(), from_attributes=True)
+    return Response(
+        content=patient_list_adapter.dump_json(patients),
+        media_type="application/json"
+    )
 
 @app.get("/patients/{patient_id}", response_model=PatientResponse)
-def get_patient(
+async def get_patient(
     patient_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_doctor: Doctor = Depends(get_current_doctor)
 ):
-    patient = db.query(Patient).filter(Patient.id == patient_id).first()
+    patient = await db.get(Patient, patient_id)
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -127,43 +214,49 @@ def get_patient(
     return patient
 
 @app.put("/patients/{patient_id}", response_model=PatientResponse)
-def update_patient(
+async def update_patient(
     patient_id: int,
     patient_data: PatientUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_doctor: Doctor = Depends(get_current_doctor)
 ):
-    patient = db.query(Patient).filter(Patient.id == patient_id).first()
+    # Update only provided fields, in a single UPDATE statement; MySQL
+    # lacks UPDATE ... RETURNING, so the fresh row comes from a pk get
+    update_data = dump_patient_update(patient_data, exclude_unset=True)
+    if update_data:
+        result = await db.execute(
+            update(Patient).where(Patient.id == patient_id).values(**update_data)
+        )
+        if result.rowcount == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Patient not found"
+            )
+        await db.commit()
+
+    patient = await db.get(Patient, patient_id)
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Patient not found"
         )
-    
-    # Update only provided fields
-    update_data = patient_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(patient, key, value)
-    
-    db.commit()
-    db.refresh(patient)
-    
+
     return patient
 
 @app.delete("/patients/{patient_id}", status_code=status.HTTP_200_OK)
-def delete_patient(
+async def delete_patient(
     patient_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_doctor: Doctor = Depends(get_current_doctor)
 ):
-    patient = db.query(Patient).filter(Patient.id == patient_id).first()
+    patient = await db.get(Patient, patient_id)
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Patient not found"
         )
-    
-    db.delete(patient)
-    db.commit()
-    
+
+    await db.delete(patient)
+    await db.commit()
+
     return {"message": "Patient deleted successfully"}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Enum, Text, DateTime
+from sqlalchemy import Column, Computed, Index, Integer, String, Float, Enum, Text, DateTime
 from sqlalchemy.sql import func
 from database import Base
 import enum
@@ -27,6 +27,13 @@ class Patient(Base):
     gender = Column(Enum(GenderEnum), nullable=False)
     height = Column(Float, nullable=False)
     weight = Column(Float, nullable=False)
+    bmi = Column(Float, Computed("round(weight / (height * height), 2)", persisted=True))
     diagnosis = Column(Text, nullable=True)
     prescription = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_patients_created_at", created_at.desc()),
+        Index("ix_patients_gender_age", "gender", "age"),
+        Index("ix_patients_city", "city"),
+    )
@@ -21,7 +21,20 @@ CREATE TABLE IF NOT EXISTS patients (
     gender ENUM('male', 'female', 'others') NOT NULL,
     height FLOAT NOT NULL,
     weight FLOAT NOT NULL,
+    bmi FLOAT GENERATED ALWAYS AS (ROUND(weight / (height * height), 2)) STORED,
     diagnosis TEXT,
     prescription TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX ix_patients_created_at (created_at DESC),
+    INDEX ix_patients_gender_age (gender, age),
+    INDEX ix_patients_city (city)
 );
+
+-- Upgrade steps for databases created before the generated bmi column
+-- and the patients indexes (CREATE TABLE IF NOT EXISTS skips existing
+-- tables). Applied automatically at startup when RUN_MIGRATIONS=1;
+-- listed here for the manual path:
+-- ALTER TABLE patients ADD COLUMN bmi FLOAT GENERATED ALWAYS AS (ROUND(weight / (height * height), 2)) STORED;
+-- CREATE INDEX ix_patients_created_at ON patients (created_at DESC);
+-- CREATE INDEX ix_patients_gender_age ON patients (gender, age);
+-- CREATE INDEX ix_patients_city ON patients (city);
@@ -1,15 +1,28 @@
-from pydantic import BaseModel, Field, EmailStr, computed_field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, computed_field
 from typing import Annotated, Literal, Optional
 from datetime import datetime
+import re
+
+from models import GenderEnum
+
+# Syntax-only email check; much cheaper than email-validator per request
+_EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+def _validate_email(value: str) -> str:
+    if not _EMAIL_REGEX.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+Email = Annotated[str, AfterValidator(_validate_email)]
 
 # Doctor Schemas
 class DoctorRegister(BaseModel):
     name: Annotated[str, Field(..., description="Doctor's name")]
-    email: Annotated[EmailStr, Field(..., description="Doctor's email")]
+    email: Annotated[Email, Field(..., description="Doctor's email")]
     password: Annotated[str, Field(..., min_length=6, description="Password (min 6 chars)")]
 
 class DoctorLogin(BaseModel):
-    email: Annotated[EmailStr, Field(..., description="Doctor's email")]
+    email: Annotated[Email, Field(..., description="Doctor's email")]
     password: Annotated[str, Field(..., description="Doctor's password")]
 
 class DoctorResponse(BaseModel):
@@ -50,22 +63,49 @@ class PatientUpdate(BaseModel):
     prescription: Annotated[Optional[str], Field(default=None)]
 
 class PatientResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
     id: int
     name: str
     city: str
     age: int
-    gender: str
+    gender: GenderEnum
     height: float
     weight: float
+    bmi: float
     diagnosis: Optional[str]
     prescription: Optional[str]
     created_at: datetime
 
     @computed_field
     @property
-    def bmi(self) -> float:
-        return round(self.weight / (self.height ** 2), 2)
-    
+    def verdict(self) -> str:
+        bmi_value = self.bmi
+        if bmi_value < 18.5:
+            return 'Underweight'
+        elif bmi_value < 25:
+            return 'Normal'
+        elif bmi_value < 30:
+            return 'Overweight'
+        else:
+            return 'Obese'
+
+class PatientListItem(BaseModel):
+    """Row shape for list views; the dashboard renders and edits from these"""
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+    id: int
+    name: str
+    city: str
+    age: int
+    gender: GenderEnum
+    height: float
+    weight: float
+    bmi: float
+    diagnosis: Optional[str]
+    prescription: Optional[str]
+    created_at: datetime
+
     @computed_field
     @property
     def verdict(self) -> str:
@@ -78,6 +118,3 @@ class PatientResponse(BaseModel):
             return 'Overweight'
         else:
             return 'Obese'
-
-    class Config:
-        from_attributes = True
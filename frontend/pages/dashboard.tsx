@@ -16,10 +16,14 @@ interface Patient {
   verdict: string;
 }
 
+const PAGE_SIZE = 50;
+
 export default function Dashboard() {
   const router = useRouter();
   const [patients, setPatients] = useState<Patient[]>([]);
   const [loading, setLoading] = useState(true);
+  const [hasMore, setHasMore] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [showModal, setShowModal] = useState(false);
   const [editingPatient, setEditingPatient] = useState<Patient | null>(null);
   const [formData, setFormData] = useState({
@@ -44,8 +48,9 @@ export default function Dashboard() {
 
   const fetchPatients = async () => {
     try {
-      const data = await api.getPatients();
+      const data = await api.getPatients(0, PAGE_SIZE);
       setPatients(data);
+      setHasMore(data.length === PAGE_SIZE);
     } catch (error) {
       console.error('Failed to fetch patients:', error);
       router.push('/login');
@@ -54,6 +59,19 @@ export default function Dashboard() {
     }
   };
 
+  const loadMorePatients = async () => {
+    setLoadingMore(true);
+    try {
+      const data = await api.getPatients(patients.length, PAGE_SIZE);
+      setPatients([...patients, ...data]);
+      setHasMore(data.length === PAGE_SIZE);
+    } catch (error) {
+      console.error('Failed to fetch patients:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleLogout = () => {
     removeToken();
     router.push('/login');
@@ -168,6 +186,7 @@ export default function Dashboard() {
             <p>No patients found. Add your first patient!</p>
           </div>
         ) : (
+          <>
           <div className="patients-grid">
             {patients.map((patient) => (
               <div key={patient.id} className="patient-card">
@@ -210,6 +229,14 @@ export default function Dashboard() {
               </div>
             ))}
           </div>
+          {hasMore && (
+            <div className="text-center">
+              <button className="btn" onClick={loadMorePatients} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load More'}
+              </button>
+            </div>
+          )}
+          </>
         )}
       </div>
 
@@ -55,9 +55,9 @@ export const api = {
     return response.json();
   },
 
-  async getPatients() {
+  async getPatients(skip: number = 0, limit: number = 50) {
     const token = getToken();
-    const response = await fetch(`${API_URL}/patients`, {
+    const response = await fetch(`${API_URL}/patients?skip=${skip}&limit=${limit}`, {
       headers: { Authorization: `Bearer ${token}` },
     });
     if (!response.ok) throw new Error('Failed to fetch patients');